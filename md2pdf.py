@@ -4,192 +4,338 @@
 Usage:
     python md2pdf.py input.md [output.pdf]
     python md2pdf.py input.md  # Creates input.pdf
+    python md2pdf.py a.md b.md c.md  # Creates a.pdf, b.pdf, c.pdf
+    python md2pdf.py "docs/*.md"  # Glob patterns are expanded
+    python md2pdf.py --breaks notes.md  # Keep single newlines as line breaks
 """
 
+import functools
+import importlib
+import os
 import re
 import subprocess
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-import markdown
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 
-def preprocess_markdown(content: str) -> str:
-    """Normalize markdown by adding blank lines before lists."""
-    lines = content.split('\n')
-    result = []
+@functools.lru_cache(maxsize=1)
+def _parser_kind() -> str:
+    """Import the fastest installed markdown parser and name it.
+
+    Called on first conversion rather than at module load, so
+    `md2pdf --help` and argument errors don't pay for loading a parser.
+    A parser that is installed but fails to import, or is too old, is skipped.
+    """
+    # cmarkgfm ("fast" extra) and mistune ("mistune" extra) are optional
+    for name in ("cmarkgfm", "mistune"):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        # mistune 0.8.x (still pulled in by older Jupyter stacks) predates the
+        # create_markdown API used here
+        if name == "mistune" and not hasattr(module, "create_markdown"):
+            continue
+        return name
+    return "python-markdown"
+
+
+@functools.lru_cache(maxsize=None)
+def _mistune_parser(breaks: bool):
+    """Return a shared mistune parser so its compiled rules are reused across documents."""
+    import mistune
+
+    return mistune.create_markdown(
+        escape=False,
+        hard_wrap=breaks,
+        plugins=['table', 'strikethrough', 'url', 'footnotes', 'def_list'],
+    )
+
 
-    for i, line in enumerate(lines):
-        # Check if this line starts a list (unordered or ordered)
-        is_list_item = re.match(r'^(\s*)[-*+]\s', line) or re.match(r'^(\s*)\d+\.\s', line)
+# Python-Markdown instances keep per-document state, so each thread gets its own
+_markdown_local = threading.local()
 
-        if is_list_item and i > 0:
-            prev_line = lines[i-1].strip()
-            # Add blank line before list if previous line is not blank and not a list item
-            prev_is_list = re.match(r'^[-*+]\s', prev_line) or re.match(r'^\d+\.\s', prev_line)
-            if prev_line and not prev_is_list:
-                result.append('')
 
-        result.append(line)
+def _python_markdown(extensions: tuple):
+    """Return this thread's Markdown instance for the given extensions."""
+    instances = getattr(_markdown_local, "instances", None)
+    if instances is None:
+        instances = _markdown_local.instances = {}
 
-    return '\n'.join(result)
+    md = instances.get(extensions)
+    if md is None:
+        import markdown
 
+        md = instances[extensions] = markdown.Markdown(extensions=list(extensions))
+    return md
 
-def convert_md_to_html(md_file: Path, html_file: Path) -> None:
-    """Convert markdown file to styled HTML."""
-    md_content = md_file.read_text()
-    md_content = preprocess_markdown(md_content)
 
-    html_content = f"""
+# A non-blank line that is not itself a list item, followed by a list item
+_LIST_RE = re.compile(
+    r'^((?![^\S\n]*(?:[-*+]|\d+\.)[^\S\n]+\S)[^\n]*\S[^\n]*\n)'
+    r'(?=[^\S\n]*(?:[-*+]|\d+\.)[^\S\n])',
+    re.MULTILINE,
+)
+
+
+def preprocess_markdown(content: str) -> str:
+    """Normalize markdown by adding blank lines before lists.
+
+    Only needed for Python-Markdown, which (even with sane_lists) treats a
+    list that directly follows a paragraph line as part of the paragraph.
+    """
+    return _LIST_RE.sub(r'\1\n', content)
+
+
+# Stylesheet and page skeleton shared by every document
+_CSS = """\
+/* Custom PDF styling */
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    font-size: 9pt;
+    line-height: 1.8;
+    color: #333;
+    max-width: 100%;
+}
+
+/* Headings */
+h1 {
+    font-size: 14pt;
+    font-weight: 600;
+    margin-top: 20pt;
+    margin-bottom: 10pt;
+    color: #1a1a1a;
+}
+
+h2 {
+    font-size: 12pt;
+    font-weight: 600;
+    margin-top: 16pt;
+    margin-bottom: 8pt;
+    color: #2a2a2a;
+}
+
+h3 {
+    font-size: 10pt;
+    font-weight: 600;
+    margin-top: 12pt;
+    margin-bottom: 6pt;
+    color: #3a3a3a;
+}
+
+h4 {
+    font-size: 9pt;
+    font-weight: 600;
+    margin-top: 10pt;
+    margin-bottom: 5pt;
+    color: #4a4a4a;
+}
+
+/* Paragraphs */
+p {
+    margin-bottom: 10pt;
+}
+
+/* Code blocks */
+pre {
+    background-color: #f5f5f5;
+    border: 1px solid #ddd;
+    border-radius: 3px;
+    padding: 8pt;
+    font-family: 'SF Mono', Monaco, 'Courier New', monospace;
+    font-size: 7pt;
+    line-height: 1.6;
+    overflow-x: auto;
+}
+
+code {
+    font-family: 'SF Mono', Monaco, 'Courier New', monospace;
+    font-size: 7pt;
+    background-color: #f5f5f5;
+    padding: 2pt 4pt;
+    border-radius: 3px;
+}
+
+/* Tables */
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 10pt 0;
+    font-size: 8pt;
+}
+
+th {
+    background-color: #f0f0f0;
+    font-weight: 600;
+    padding: 8pt;
+    text-align: left;
+    border: 1px solid #ddd;
+}
+
+td {
+    padding: 6pt 8pt;
+    border: 1px solid #ddd;
+}
+
+/* Lists */
+ul, ol {
+    margin: 8pt 0;
+    padding-left: 20pt;
+}
+
+li {
+    margin-bottom: 4pt;
+}
+
+/* Links */
+a {
+    color: #0066cc;
+    text-decoration: none;
+}
+
+/* Blockquotes */
+blockquote {
+    border-left: 4px solid #ddd;
+    margin: 12pt 0;
+    padding-left: 12pt;
+    color: #666;
+    font-style: italic;
+}
+
+/* Horizontal rules */
+hr {
+    border: none;
+    border-top: 1px solid #ddd;
+    margin: 20pt 0;
+}
+
+/* Strong/bold */
+strong {
+    font-weight: 600;
+}
+
+/* Emphasis */
+em {
+    font-style: italic;
+}
+"""
+
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>{md_file.stem}</title>
+    <title>{title}</title>
     <style>
-        /* Custom PDF styling */
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            font-size: 9pt;
-            line-height: 1.8;
-            color: #333;
-            max-width: 100%;
-        }}
-
-        /* Headings */
-        h1 {{
-            font-size: 14pt;
-            font-weight: 600;
-            margin-top: 20pt;
-            margin-bottom: 10pt;
-            color: #1a1a1a;
-        }}
-
-        h2 {{
-            font-size: 12pt;
-            font-weight: 600;
-            margin-top: 16pt;
-            margin-bottom: 8pt;
-            color: #2a2a2a;
-        }}
-
-        h3 {{
-            font-size: 10pt;
-            font-weight: 600;
-            margin-top: 12pt;
-            margin-bottom: 6pt;
-            color: #3a3a3a;
-        }}
-
-        h4 {{
-            font-size: 9pt;
-            font-weight: 600;
-            margin-top: 10pt;
-            margin-bottom: 5pt;
-            color: #4a4a4a;
-        }}
-
-        /* Paragraphs */
-        p {{
-            margin-bottom: 10pt;
-        }}
-
-        /* Code blocks */
-        pre {{
-            background-color: #f5f5f5;
-            border: 1px solid #ddd;
-            border-radius: 3px;
-            padding: 8pt;
-            font-family: 'SF Mono', Monaco, 'Courier New', monospace;
-            font-size: 7pt;
-            line-height: 1.6;
-            overflow-x: auto;
-        }}
-
-        code {{
-            font-family: 'SF Mono', Monaco, 'Courier New', monospace;
-            font-size: 7pt;
-            background-color: #f5f5f5;
-            padding: 2pt 4pt;
-            border-radius: 3px;
-        }}
-
-        /* Tables */
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 10pt 0;
-            font-size: 8pt;
-        }}
-
-        th {{
-            background-color: #f0f0f0;
-            font-weight: 600;
-            padding: 8pt;
-            text-align: left;
-            border: 1px solid #ddd;
-        }}
-
-        td {{
-            padding: 6pt 8pt;
-            border: 1px solid #ddd;
-        }}
-
-        /* Lists */
-        ul, ol {{
-            margin: 8pt 0;
-            padding-left: 20pt;
-        }}
-
-        li {{
-            margin-bottom: 4pt;
-        }}
-
-        /* Links */
-        a {{
-            color: #0066cc;
-            text-decoration: none;
-        }}
-
-        /* Blockquotes */
-        blockquote {{
-            border-left: 4px solid #ddd;
-            margin: 12pt 0;
-            padding-left: 12pt;
-            color: #666;
-            font-style: italic;
-        }}
-
-        /* Horizontal rules */
-        hr {{
-            border: none;
-            border-top: 1px solid #ddd;
-            margin: 20pt 0;
-        }}
-
-        /* Strong/bold */
-        strong {{
-            font-weight: 600;
-        }}
-
-        /* Emphasis */
-        em {{
-            font-style: italic;
-        }}
-    </style>
+{css}</style>
 </head>
 <body>
-{markdown.markdown(md_content, extensions=['extra', 'sane_lists', 'nl2br'])}
+{body}
 </body>
 </html>
 """
 
-    html_file.write_text(html_content)
-    print(f"✓ HTML generated: {html_file}")
 
+# Inputs larger than this are decoded straight from a memory map
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_markdown(md_file: Path) -> str:
+    """Read a markdown file as UTF-8 text.
+
+    Large files are decoded directly out of a memory map, so no bytes copy
+    of the whole document is held alongside the decoded text.
+    """
+    with open(md_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return f.read().decode("utf-8")
+
+        import mmap
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return str(mm, "utf-8")
+        finally:
+            mm.close()
+
+
+def convert_md_to_html(md_file: Path, breaks: bool = False, sane_lists: bool = False) -> str:
+    """Convert markdown file to styled HTML and return it.
+
+    breaks turns every newline into a <br> (like Python-Markdown's nl2br).
+    sane_lists enables Python-Markdown's sane_lists extension; the other
+    parsers follow CommonMark, whose list rules already behave that way.
+    """
+    md_content = _read_markdown(md_file)
+
+    parser_kind = _parser_kind()
+
+    # CommonMark parsers already start lists without a preceding blank line
+    if parser_kind == "python-markdown":
+        md_content = preprocess_markdown(md_content)
+
+    if parser_kind == "cmarkgfm":
+        import cmarkgfm
+        from cmarkgfm.cmark import Options as cmarkgfmOptions
+
+        options = cmarkgfmOptions.CMARK_OPT_UNSAFE | cmarkgfmOptions.CMARK_OPT_FOOTNOTES
+        if breaks:
+            options |= cmarkgfmOptions.CMARK_OPT_HARDBREAKS
+        html_body = cmarkgfm.github_flavored_markdown_to_html(md_content, options=options)
+    elif parser_kind == "mistune":
+        html_body = _mistune_parser(breaks)(md_content)
+    else:
+        extensions = ['extra']
+        if sane_lists:
+            extensions.append('sane_lists')
+        if breaks:
+            extensions.append('nl2br')
+
+        html_body = _python_markdown(tuple(extensions)).reset().convert(md_content)
+
+    html_content = _HTML_TEMPLATE.format(title=md_file.stem, css=_CSS, body=html_body)
+
+    return html_content
+
+
+# Raw HTML in the markdown can pull in remote images, so cap how long Chrome
+# waits for a document to finish loading before printing what it has
+_LOAD_BUDGET_MS = 2000
+# Longest wait for any single DevTools reply before Chrome is presumed hung
+_COMMAND_TIMEOUT = 30
+
+# Skip browser features that only cost startup time and memory when printing
+_CHROME_FLAGS = [
+    "--headless",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--disable-dev-shm-usage",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome() -> str:
+    """Return the Chrome/Chromium binary to use, honouring $CHROME_PATH."""
+    env_path = os.environ.get("CHROME_PATH")
+    if env_path:
+        if not os.path.isfile(env_path):
+            raise RuntimeError(f"CHROME_PATH does not point to a file: {env_path}")
+        return env_path
 
-def convert_html_to_pdf(html_file: Path, pdf_file: Path) -> None:
-    """Convert HTML to PDF using headless Chrome."""
     chrome_paths = [
         "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
         "/usr/bin/google-chrome",
@@ -197,65 +343,460 @@ def convert_html_to_pdf(html_file: Path, pdf_file: Path) -> None:
         "/usr/bin/chromium",
     ]
 
-    chrome_path = None
     for path in chrome_paths:
-        if Path(path).exists():
-            chrome_path = path
-            break
+        if os.path.isfile(path):
+            return path
 
-    if not chrome_path:
-        raise RuntimeError(
-            "Chrome/Chromium not found. Install Google Chrome or set CHROME_PATH env var."
-        )
+    raise RuntimeError(
+        "Chrome/Chromium not found. Install Google Chrome or set CHROME_PATH env var."
+    )
 
-    cmd = [
-        chrome_path,
-        "--headless",
-        "--disable-gpu",
-        f"--print-to-pdf={pdf_file.absolute()}",
-        str(html_file.absolute()),
-    ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+def _pdf_temp_path(pdf_file: Path) -> Path:
+    """Scratch path beside pdf_file, renamed over it once the PDF is complete."""
+    return pdf_file.with_name(f".{pdf_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-    if result.returncode != 0:
-        raise RuntimeError(f"Chrome conversion failed: {result.stderr}")
 
-    if pdf_file.exists():
-        size_kb = pdf_file.stat().st_size / 1024
-        print(f"✓ PDF generated: {pdf_file} ({size_kb:.1f} KB)")
-    else:
-        raise RuntimeError("PDF file was not created")
+_HEAD_RE = re.compile(r'<head(?:\s[^>]*)?>', re.IGNORECASE)
+
+
+def _with_base_href(html_content: str, base_dir: Path) -> str:
+    """Point relative URLs in the document at base_dir via a <base> element."""
+    base_url = base_dir.absolute().as_uri()
+    if not base_url.endswith("/"):
+        base_url += "/"
+    base_tag = f'<base href="{base_url}">'
+    html_content, found = _HEAD_RE.subn(lambda m: m.group(0) + base_tag, html_content, count=1)
+    return html_content if found else base_tag + html_content
+
+
+def convert_html_to_pdf(html_content: str, pdf_file: Path,
+                        base_dir: Optional[Path] = None) -> None:
+    """Convert HTML to PDF using a one-off headless Chrome.
+
+    Chrome is given the HTML through a temporary file next to pdf_file,
+    removed once it is done; ChromeRenderer avoids the file and keeps
+    Chrome running between documents. Relative links and images resolve against base_dir
+    (normally the markdown file's directory) when it is given.
+    """
+    chrome_path = _find_chrome()
+    import tempfile
+
+    if base_dir is not None:
+        html_content = _with_base_href(html_content, base_dir)
+
+    # Kept beside the output rather than in /tmp, which sandboxed Chrome
+    # builds (e.g. snap Chromium) may not be able to see
+    fd, html_path = tempfile.mkstemp(
+        prefix="md2pdf-", suffix=".html", dir=pdf_file.absolute().parent
+    )
+    tmp_pdf = _pdf_temp_path(pdf_file)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(html_content)
+
+        cmd = [
+            chrome_path,
+            *_CHROME_FLAGS,
+            f"--virtual-time-budget={_LOAD_BUDGET_MS}",
+            "--run-all-compositor-stages-before-draw",
+            "--timeout=5000",
+            f"--print-to-pdf={tmp_pdf.absolute()}",
+            html_path,
+        ]
+
+        # Chrome is chatty on stdout/stderr; only stderr is kept, and only decoded on failure
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Chrome conversion failed: {stderr}")
+
+        if not tmp_pdf.exists():
+            raise RuntimeError("PDF file was not created")
+        os.replace(tmp_pdf, pdf_file)
+    finally:
+        os.unlink(html_path)
+        if tmp_pdf.exists():
+            tmp_pdf.unlink()
+
+    size_kb = pdf_file.stat().st_size / 1024
+    print(f"✓ PDF generated: {pdf_file} ({size_kb:.1f} KB)")
+
+
+# Resolves once the injected document and its images have finished loading,
+# or once the load budget runs out
+_WAIT_FOR_LOAD_JS = f"""
+new Promise(resolve => {{
+    if (document.readyState === 'complete') resolve();
+    else window.addEventListener('load', () => resolve());
+    setTimeout(resolve, {_LOAD_BUDGET_MS});
+}})
+"""
+
+
+class ChromeRenderer:
+    """Headless Chrome driven over the DevTools protocol.
+
+    One browser is kept alive across render() calls, each document getting
+    its own tab, so only the first document pays for Chrome's startup.
+    render() is thread-safe: several tabs can print at once, with a reader
+    thread routing Chrome's replies back to the callers waiting on them.
+
+    Chrome is spawned by start() and exchanges NUL-terminated JSON messages
+    with us over a pair of pipes (--remote-debugging-pipe). Spawning does not
+    wait for Chrome to boot, so callers can start it before converting
+    markdown and have the two overlap.
+    """
+
+    def __init__(self, chrome_path: Optional[str] = None):
+        self.chrome_path = chrome_path
+        self._process = None
+        self._writer = None
+        self._reader_thread = None
+        self._connected = False
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._pending = {}
+        self._event_waiters = {}
+
+    def __enter__(self) -> "ChromeRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Spawn Chrome without waiting for it to finish starting up."""
+        with self._lock:
+            if self._process is not None:
+                return
+
+            chrome_path = self.chrome_path or _find_chrome()
+            to_chrome_r, to_chrome_w = os.pipe()
+            from_chrome_r, from_chrome_w = os.pipe()
+
+            def attach_pipes():
+                # Chrome reads commands from fd 3 and writes replies to fd 4
+                reply_fd = os.dup(from_chrome_w) if from_chrome_w == 3 else from_chrome_w
+                os.dup2(to_chrome_r, 3)
+                os.dup2(reply_fd, 4)
+                os.set_inheritable(3, True)
+                os.set_inheritable(4, True)
+
+            cmd = [chrome_path, *_CHROME_FLAGS, "--remote-debugging-pipe"]
+
+            try:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,  # fds 3 and 4 must survive exec; the rest are non-inheritable
+                    preexec_fn=attach_pipes,
+                )
+            except OSError:
+                os.close(to_chrome_w)
+                os.close(from_chrome_r)
+                raise
+            finally:
+                os.close(to_chrome_r)
+                os.close(from_chrome_w)
+
+            self._writer = os.fdopen(to_chrome_w, "wb")
+            self._connected = True
+            self._reader_thread = threading.Thread(
+                target=self._read_replies,
+                args=(os.fdopen(from_chrome_r, "rb", buffering=0),),
+                daemon=True,
+            )
+            self._reader_thread.start()
+
+    def close(self) -> None:
+        """Shut Chrome down."""
+        if self._process is None:
+            return
+
+        try:
+            self._call("Browser.close", timeout=5)
+        except RuntimeError:
+            pass  # Chrome may drop the pipe before replying
+
+        try:
+            self._writer.close()
+        except OSError:
+            pass  # unflushed commands to a Chrome that has already gone
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._reader_thread.join()
+
+        self._process = None
+
+    def render(self, html_content: str, pdf_file: Path, source_file: Path) -> None:
+        """Print an HTML document to PDF in a fresh tab.
+
+        The HTML is injected straight into the tab. So that the document is
+        allowed to load local files, the tab first opens an empty file://
+        page, written next to pdf_file and removed again afterwards;
+        relative links and images resolve against source_file (the markdown
+        the HTML came from) as they would next to it on disk.
+        """
+        import base64
+        import tempfile
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        self.start()
+
+        html_content = _with_base_href(html_content, source_file.parent)
+        fd, blank_path = tempfile.mkstemp(
+            prefix="md2pdf-", suffix=".html", dir=pdf_file.absolute().parent
+        )
+        os.close(fd)
+        try:
+            target_id = self._call("Target.createTarget", {"url": "about:blank"})["targetId"]
+            try:
+                session_id = self._call(
+                    "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+                )["sessionId"]
+                self._call("Page.enable", session_id=session_id)
+                loaded = self._expect_event("Page.loadEventFired", session_id)
+                navigation = self._call(
+                    "Page.navigate", {"url": Path(blank_path).as_uri()}, session_id
+                )
+                if "errorText" in navigation:
+                    raise RuntimeError(f"Chrome conversion failed: {navigation['errorText']}")
+                try:
+                    loaded.result(timeout=_COMMAND_TIMEOUT)
+                except FutureTimeoutError:
+                    raise RuntimeError("Chrome timed out loading the page") from None
+
+                self._call(
+                    "Page.setDocumentContent",
+                    {"frameId": navigation["frameId"], "html": html_content},
+                    session_id,
+                )
+                self._call(
+                    "Runtime.evaluate",
+                    {"expression": _WAIT_FOR_LOAD_JS, "awaitPromise": True},
+                    session_id,
+                )
+                result = self._call("Page.printToPDF", {"displayHeaderFooter": True}, session_id)
+            finally:
+                try:
+                    self._call("Target.closeTarget", {"targetId": target_id})
+                except RuntimeError:
+                    pass  # don't mask the original error if Chrome has died
+        finally:
+            os.unlink(blank_path)
+
+        # Rename into place so readers never see a half-written PDF
+        pdf_bytes = base64.b64decode(result["data"])
+        tmp_pdf = _pdf_temp_path(pdf_file)
+        try:
+            tmp_pdf.write_bytes(pdf_bytes)
+            os.replace(tmp_pdf, pdf_file)
+        finally:
+            if tmp_pdf.exists():
+                tmp_pdf.unlink()
+        print(f"✓ PDF generated: {pdf_file} ({len(pdf_bytes) / 1024:.1f} KB)")
+
+    def _call(self, method: str, params: Optional[dict] = None,
+              session_id: Optional[str] = None,
+              timeout: float = _COMMAND_TIMEOUT) -> dict:
+        """Send a DevTools command and wait up to timeout seconds for its result."""
+        import json
+        from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+        future = Future()
+        with self._lock:
+            if not self._connected:
+                raise RuntimeError("Chrome exited unexpectedly")
+
+            self._next_id += 1
+            message = {"id": self._next_id, "method": method, "params": params or {}}
+            if session_id:
+                message["sessionId"] = session_id
+
+            self._pending[message["id"]] = future
+            try:
+                self._writer.write(json.dumps(message).encode() + b"\0")
+                self._writer.flush()
+            except OSError as e:
+                self._pending.pop(message["id"], None)
+                raise RuntimeError("Chrome exited unexpectedly") from e
+
+        try:
+            reply = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._pending.pop(message["id"], None)
+            raise RuntimeError(f"Chrome did not respond to {method}") from None
+        if "error" in reply:
+            raise RuntimeError(f"Chrome conversion failed: {reply['error'].get('message')}")
+        return reply.get("result", {})
+
+    def _expect_event(self, method: str, session_id: str) -> "Future":
+        """Return a future for the next such event; register before triggering it."""
+        from concurrent.futures import Future
+
+        future = Future()
+        with self._lock:
+            self._event_waiters[(method, session_id)] = future
+        return future
+
+    def _read_replies(self, reader) -> None:
+        """Reader thread: hand each message from Chrome to whoever awaits it."""
+        import json
+
+        buffer = bytearray()
+        with reader:
+            while True:
+                chunk = reader.read(65536)
+                if not chunk:
+                    break
+
+                start = len(buffer)
+                buffer += chunk
+                end = buffer.find(b"\0", start)
+                while end != -1:
+                    self._dispatch(json.loads(buffer[:end]))
+                    del buffer[:end + 1]
+                    end = buffer.find(b"\0")
+
+        with self._lock:
+            self._connected = False
+            waiters = [*self._pending.values(), *self._event_waiters.values()]
+            self._pending.clear()
+            self._event_waiters.clear()
+
+        for future in waiters:
+            future.set_exception(RuntimeError("Chrome exited unexpectedly"))
+
+    def _dispatch(self, message: dict) -> None:
+        with self._lock:
+            if "id" in message:
+                future = self._pending.pop(message["id"], None)
+            else:
+                key = (message.get("method"), message.get("sessionId"))
+                future = self._event_waiters.pop(key, None)
+
+        if future is not None:
+            future.set_result(message)
+
+
+# Tabs printing concurrently in one browser, and how many documents a
+# browser prints before being replaced (Chrome's memory use creeps up)
+_TAB_POOL_SIZE = 4
+_RENDERS_PER_BROWSER = 50
+
+
+def _expand_inputs(args: list) -> list:
+    """Expand glob patterns, keeping literal paths and unmatched arguments as-is.
+
+    Arguments naming an existing file are never globbed (the shell may
+    already have expanded them, and "notes[1].md" is a valid name), and
+    files reached more than once are only converted once.
+    """
+    import glob
+
+    md_files = {}
+    for arg in args:
+        if Path(arg).exists() or not glob.has_magic(arg):
+            matches = [arg]
+        else:
+            matches = sorted(glob.glob(arg, recursive=True)) or [arg]
+
+        for match in matches:
+            md_files.setdefault(os.path.abspath(match), Path(match))
+    return list(md_files.values())
+
+
+def _render_file(renderer: ChromeRenderer, html_future: "Future", md_file: Path,
+                 pdf_file: Path) -> None:
+    """Print one document to PDF in a tab of the given renderer, once its HTML is ready."""
+    renderer.render(html_future.result(), pdf_file, md_file)
+
+    print(f"\n✓ Conversion complete: {md_file} -> {pdf_file}")
 
 
 def main():
-    if len(sys.argv) < 2:
+    # Imported here so that importing md2pdf as a library stays cheap
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("files", nargs="*", help="markdown files or glob patterns")
+    parser.add_argument(
+        "--breaks", action="store_true", help="treat every newline as a line break"
+    )
+    parser.add_argument(
+        "--sane-lists", action="store_true",
+        help="use Python-Markdown's sane_lists extension (fallback parser only)",
+    )
+    options = parser.parse_args()
+
+    if not options.files:
         print(__doc__)
         sys.exit(1)
 
-    md_file = Path(sys.argv[1])
-    if not md_file.exists():
-        print(f"Error: File not found: {md_file}")
-        sys.exit(1)
-
-    if not md_file.suffix == ".md":
-        print("Warning: Input file doesn't have .md extension")
-
-    # Determine output PDF file
-    if len(sys.argv) >= 3:
-        pdf_file = Path(sys.argv[2])
+    # Determine output PDF files: with two arguments the second is the output
+    # if it is a .pdf or names no existing input (the original CLI form)
+    args = options.files
+    if len(args) == 2 and (
+        Path(args[1]).suffix == ".pdf"
+        or not any(path.exists() for path in _expand_inputs(args[1:]))
+    ):
+        jobs = [(Path(args[0]), Path(args[1]))]
     else:
-        pdf_file = md_file.with_suffix(".pdf")
+        jobs = [(md_file, md_file.with_suffix(".pdf")) for md_file in _expand_inputs(args)]
 
-    # Create temporary HTML file
-    html_file = md_file.with_suffix(".html")
+    for md_file, _ in jobs:
+        if not md_file.exists():
+            print(f"Error: File not found: {md_file}")
+            sys.exit(1)
 
-    try:
-        # Convert MD -> HTML -> PDF
-        convert_md_to_html(md_file, html_file)
-        convert_html_to_pdf(html_file, pdf_file)
+        if not md_file.suffix == ".md":
+            print(f"Warning: Input file doesn't have .md extension: {md_file}")
 
-        print(f"\n✓ Conversion complete: {md_file} -> {pdf_file}")
+    try:
+        chrome_path = _find_chrome()
+        md_options = {"breaks": options.breaks, "sane_lists": options.sane_lists}
+
+        # MD -> HTML is CPU-bound Python, so batches are parsed in worker
+        # processes; a single file isn't worth starting them (or importing
+        # multiprocessing)
+        if len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            parsers = ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1))
+        else:
+            parsers = ThreadPoolExecutor(max_workers=1)
+
+        with parsers:
+            for i in range(0, len(jobs), _RENDERS_PER_BROWSER):
+                batch = jobs[i:i + _RENDERS_PER_BROWSER]
+
+                # Queue the parsing before Chrome starts (so workers are forked
+                # from a single-threaded process), let Chrome boot meanwhile,
+                # then print each document in a pool of tabs as its HTML arrives
+                html_futures = [
+                    parsers.submit(convert_md_to_html, md_file, **md_options)
+                    for md_file, _ in batch
+                ]
+                with ChromeRenderer(chrome_path) as renderer, \
+                        ThreadPoolExecutor(max_workers=_TAB_POOL_SIZE) as tabs:
+                    futures = [
+                        tabs.submit(_render_file, renderer, html_future, md_file, pdf_file)
+                        for html_future, (md_file, pdf_file) in zip(html_futures, batch)
+                    ]
+                    for future in futures:
+                        future.result()
 
     except Exception as e:
         print(f"Error: {e}")